@@ -73,6 +73,18 @@ class BuildFfmpegCommandTests(unittest.TestCase):
         cmd = build_ffmpeg_wav_capture_cmd(output)
         self.assertIn(str(output), cmd)
 
+    def test_ffmpeg_executable_resolves_once(self) -> None:
+        from voice_controls.audio import ffmpeg_executable
+
+        ffmpeg_executable.cache_clear()
+        try:
+            with patch("voice_controls.audio.shutil.which", return_value=None) as mock_which:
+                self.assertIsNone(ffmpeg_executable())
+                self.assertIsNone(ffmpeg_executable())
+            mock_which.assert_called_once_with("ffmpeg")
+        finally:
+            ffmpeg_executable.cache_clear()
+
     def test_command_sets_mono_and_16khz(self) -> None:
         from voice_controls.audio import build_ffmpeg_wav_capture_cmd
 
@@ -125,6 +137,66 @@ class ComputeTypeForDeviceTests(unittest.TestCase):
         self.assertEqual(self._compute_type("cuda", override="int8"), "int8")
 
 
+class NotifyWorkerTests(unittest.TestCase):
+    def test_worker_delivers_in_order_and_flushes_on_stop(self) -> None:
+        import voice_controls.integrations as integrations_mod
+
+        with patch("voice_controls.integrations._send_notification") as mock_send:
+            integrations_mod.start_notify_worker()
+            try:
+                integrations_mod.notify("Voice", "first")
+                integrations_mod.notify("Voice", "second")
+            finally:
+                integrations_mod.stop_notify_worker()
+            integrations_mod.notify("Voice", "inline")
+
+        self.assertEqual(
+            [call.args for call in mock_send.call_args_list],
+            [("Voice", "first"), ("Voice", "second"), ("Voice", "inline")],
+        )
+
+
+class PreloadModelsTests(unittest.TestCase):
+    def test_warmup_failure_does_not_fail_preload(self) -> None:
+        import voice_controls.stt as stt_mod
+
+        with patch("voice_controls.stt.get_whisper_model", return_value=Mock()), patch(
+            "voice_controls.stt.MODEL_WARMUP", True
+        ), patch("voice_controls.stt.warm_up_model", side_effect=RuntimeError("boom")) as mock_warm_up:
+            stt_mod.preload_models()
+
+        mock_warm_up.assert_called_once()
+
+    def test_warmup_skipped_when_disabled(self) -> None:
+        import voice_controls.stt as stt_mod
+
+        with patch("voice_controls.stt.get_whisper_model", return_value=Mock()), patch(
+            "voice_controls.stt.MODEL_WARMUP", False
+        ), patch("voice_controls.stt.warm_up_model") as mock_warm_up:
+            stt_mod.preload_models()
+
+        mock_warm_up.assert_not_called()
+
+
+class WarmUpModelTests(unittest.TestCase):
+    def test_runs_vad_and_full_decode_passes_on_wav_input(self) -> None:
+        import wave
+        from voice_controls.stt import warm_up_model
+
+        seen = []
+
+        def fake_transcribe(audio, **kwargs):
+            with wave.open(audio, "rb") as wav:
+                seen.append((wav.getnchannels(), wav.getframerate(), kwargs["vad_filter"]))
+            return iter(()), None
+
+        model = Mock()
+        model.transcribe.side_effect = fake_transcribe
+        warm_up_model(model)
+
+        self.assertEqual(seen, [(1, 16000, True), (1, 16000, False)])
+
+
 class RecvLineTests(unittest.TestCase):
     def _make_pair(self) -> tuple[socket.socket, socket.socket]:
         return socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
@@ -145,6 +217,22 @@ class RecvLineTests(unittest.TestCase):
     def test_parses_valid_line(self) -> None:
         self.assertEqual(self._recv(b"dictate-start\n"), "dictate-start")
 
+    def test_ignores_bytes_after_newline(self) -> None:
+        self.assertEqual(self._recv(b"dictate-stop\ntrailing"), "dictate-stop")
+
+    def test_accepts_line_exactly_at_limit(self) -> None:
+        from voice_controls.app import _recv_line
+
+        server, client = self._make_pair()
+        try:
+            client.sendall(b"abcdefghi\n")
+            client.shutdown(socket.SHUT_WR)
+            server.settimeout(1.0)
+            self.assertEqual(_recv_line(server, max_bytes=10), "abcdefghi")
+        finally:
+            server.close()
+            client.close()
+
     def test_whitespace_only_line_raises(self) -> None:
         from voice_controls.app import _recv_line
 
@@ -200,6 +288,61 @@ class RequestDaemonFastFailTests(unittest.TestCase):
         mock_notify.assert_called_once_with("Voice", "Voice daemon unavailable")
 
 
+class ValidateEnvironmentTests(unittest.TestCase):
+    def test_missing_ffmpeg_fails_and_optional_tools_only_warn(self) -> None:
+        from voice_controls import app as app_mod
+
+        with patch("voice_controls.app.ffmpeg_executable", return_value=None), patch(
+            "voice_controls.app.notify"
+        ) as mock_notify:
+            self.assertFalse(app_mod.validate_environment())
+        mock_notify.assert_called_once_with("Voice", "Missing required tool: ffmpeg")
+
+        with patch("voice_controls.app.ffmpeg_executable", return_value="/usr/bin/ffmpeg"), patch(
+            "voice_controls.app.has_tool", return_value=False
+        ), patch("voice_controls.app.LOGGER") as mock_logger:
+            self.assertTrue(app_mod.validate_environment())
+        self.assertEqual(
+            [call.args for call in mock_logger.warning.call_args_list],
+            [("Missing optional tool: %s", tool) for tool in ("hyprctl", "wl-copy", "notify-send")],
+        )
+
+
+class ForkDaemonStartTests(unittest.TestCase):
+    def test_fork_only_when_runtime_python_is_current_interpreter(self) -> None:
+        import sys
+        from voice_controls.app import _can_fork_daemon
+
+        with patch("voice_controls.app.DAEMON_FORK_START", True):
+            self.assertTrue(_can_fork_daemon(sys.executable))
+            self.assertFalse(_can_fork_daemon("/nonexistent/python"))
+        with patch("voice_controls.app.DAEMON_FORK_START", False):
+            self.assertFalse(_can_fork_daemon(sys.executable))
+
+    def test_fork_refused_for_symlink_to_current_interpreter(self) -> None:
+        import sys
+        import tempfile
+        from voice_controls.app import _can_fork_daemon
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            venv_python = Path(tmpdir, "python")
+            venv_python.symlink_to(sys.executable)
+            with patch("voice_controls.app.DAEMON_FORK_START", True):
+                self.assertFalse(_can_fork_daemon(str(venv_python)))
+
+    def test_start_daemon_falls_back_to_popen_when_fork_disabled(self) -> None:
+        from voice_controls import app as app_mod
+
+        with patch("voice_controls.app._can_fork_daemon", return_value=False), patch(
+            "voice_controls.app._fork_daemon"
+        ) as mock_fork, patch("voice_controls.app.subprocess.Popen") as mock_popen:
+            proc = app_mod.start_daemon()
+
+        mock_fork.assert_not_called()
+        self.assertIs(proc, mock_popen.return_value)
+        self.assertEqual(mock_popen.call_args.args[0][-1], "--daemon")
+
+
 class IpcCompatibilityTests(unittest.TestCase):
     def test_parse_rc_line_accepts_json_payload(self) -> None:
         from voice_controls.app import _parse_rc_line
@@ -213,8 +356,239 @@ class IpcCompatibilityTests(unittest.TestCase):
         self.assertEqual(request, "dictate-start")
         self.assertTrue(wants_json)
 
+    def test_encode_rc_response_matches_dynamic_encoding(self) -> None:
+        import json
+        from voice_controls.app import _encode_rc_response
+
+        for rc in (0, 1, 2, 7):
+            self.assertEqual(_encode_rc_response(rc, False), f"{rc}\n".encode("utf-8"))
+            self.assertEqual(_encode_rc_response(rc, True), (json.dumps({"rc": rc}) + "\n").encode("utf-8"))
+
+
+class RecoveryStateEncodingTests(unittest.TestCase):
+    def test_encoded_state_round_trips_through_json(self) -> None:
+        import json
+        from voice_controls.app import DictationSession, _encode_recovery_state
+
+        proc = Mock()
+        proc.pid = 4321
+        session = DictationSession(
+            proc=proc,
+            audio_path=Path("/run/user/1000/voice-hotkey-capture/capture-0123456789abcdef.wav"),
+            started_at=1700000000.123456,
+            nonce='0123456789abcdef"\\',
+        )
+
+        payload = json.loads(_encode_recovery_state(session))
+
+        self.assertEqual(
+            payload,
+            {
+                "pid": 4321,
+                "started_at": 1700000000.123456,
+                "nonce": '0123456789abcdef"\\',
+            },
+        )
+
+
+class LoadRecoveryStateTests(unittest.TestCase):
+    def test_missing_file_returns_none_and_written_state_loads(self) -> None:
+        import tempfile
+        from voice_controls.app import DictationSession, _load_recovery_state, _write_recovery_state
+
+        proc = Mock()
+        proc.pid = 4321
+        session = DictationSession(proc=proc, audio_path=Path("unused.wav"), started_at=1.5, nonce="0123456789abcdef")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "session.json"
+            with patch("voice_controls.app.RECOVERY_STATE_PATH", state_path):
+                self.assertIsNone(_load_recovery_state())
+                _write_recovery_state(session)
+                self.assertEqual(_load_recovery_state(), {"pid": 4321, "started_at": 1.5, "nonce": "0123456789abcdef"})
+
+
+class LazyTranscriptTests(unittest.TestCase):
+    def test_formats_like_sanitize_transcript(self) -> None:
+        from voice_controls.app import _LazyTranscript, _sanitize_transcript
+
+        self.assertEqual("%s" % _LazyTranscript("secret words"), _sanitize_transcript("secret words"))
+
+
+class DiscardCaptureTests(unittest.TestCase):
+    def test_removes_capture_file_and_tolerates_missing_file(self) -> None:
+        import tempfile
+        from voice_controls.app import _discard_capture
+
+        with tempfile.TemporaryDirectory() as capture_dir:
+            audio_path = Path(capture_dir, "capture-0123456789abcdef.wav")
+            audio_path.write_bytes(b"RIFF")
+
+            _discard_capture(audio_path)
+            _discard_capture(audio_path)
+
+            self.assertFalse(audio_path.exists())
+            self.assertTrue(os.path.isdir(capture_dir))
+
+
+class RecoveryNonceTests(unittest.TestCase):
+    def test_stop_session_ignores_recovery_state_with_invalid_nonce(self) -> None:
+        from voice_controls import app as app_mod
+
+        payload = {
+            "pid": 4321,
+            "nonce": "../../etc/passwd",
+        }
+        with patch("voice_controls.app._load_recovery_state", return_value=payload), patch(
+            "voice_controls.app._clear_recovery_state"
+        ), patch("voice_controls.app._stop_capture_pid") as mock_stop_pid, patch("voice_controls.app.notify") as mock_notify:
+            rc = app_mod._stop_session()
+
+        self.assertEqual(rc, 0)
+        mock_stop_pid.assert_not_called()
+        mock_notify.assert_called_once_with("Voice", "No active dictate")
+
+    def test_stop_session_derives_audio_path_from_capture_dir_and_nonce(self) -> None:
+        from voice_controls import app as app_mod
+
+        payload = {
+            "pid": 4321,
+            "nonce": "0123456789abcdef",
+        }
+        with patch("voice_controls.app._load_recovery_state", return_value=payload), patch(
+            "voice_controls.app._clear_recovery_state"
+        ), patch("voice_controls.app._stop_capture_pid") as mock_stop_pid, patch(
+            "voice_controls.app._process_captured_audio", return_value=0
+        ) as mock_process, patch("voice_controls.app._discard_capture"), patch("voice_controls.app.notify"):
+            rc = app_mod._stop_session()
+
+        expected = app_mod.CAPTURE_DIR / "capture-0123456789abcdef.wav"
+        self.assertEqual(rc, 0)
+        mock_stop_pid.assert_called_once_with(4321, expected)
+        mock_process.assert_called_once_with(expected)
+
+
+class ConcurrentStopTests(unittest.TestCase):
+    def test_concurrent_stops_paste_a_capture_once(self) -> None:
+        import tempfile
+        import threading
+        import time
+        from voice_controls import app as app_mod
+
+        def slow_transcribe(audio_path, language=None):
+            time.sleep(0.2)
+            return "hello", "en", 0.99
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            capture_dir = Path(tmpdir)
+            nonce = "0123456789abcdef"
+            audio_path = capture_dir / f"capture-{nonce}.wav"
+            audio_path.write_bytes(b"RIFF")
+            proc = Mock()
+            proc.pid = 4321
+            session = app_mod.DictationSession(proc=proc, audio_path=audio_path, started_at=1.0, nonce=nonce)
+
+            with patch("voice_controls.app.CAPTURE_DIR", capture_dir), patch(
+                "voice_controls.app.RECOVERY_STATE_PATH", capture_dir / "session.json"
+            ), patch("voice_controls.app.ACTIVE_SESSION", session), patch(
+                "voice_controls.app._stop_capture_process"
+            ), patch("voice_controls.app._stop_capture_pid"), patch(
+                "voice_controls.app.transcribe", side_effect=slow_transcribe
+            ), patch(
+                "voice_controls.app.inject_text_into_focused_input", return_value=True
+            ) as mock_inject, patch("voice_controls.app.notify"):
+                app_mod._write_recovery_state(session)
+                threads = [threading.Thread(target=app_mod._stop_session) for _ in range(2)]
+                threads[0].start()
+                time.sleep(0.05)
+                threads[1].start()
+                for thread in threads:
+                    thread.join(5)
+
+                self.assertFalse((capture_dir / "session.json").exists())
+
+        mock_inject.assert_called_once_with("hello")
+
+
+class DaemonConnectionDeferTests(unittest.TestCase):
+    def test_transition_runs_inline_and_remainder_is_submitted(self) -> None:
+        from voice_controls import app as app_mod
+
+        order = []
+
+        def begin() -> object:
+            order.append("transition")
+            return lambda: order.append("remainder") or 0
+
+        submitted = []
+        server, client = socket.socketpair()
+        with client, patch.dict(app_mod.HOLD_INPUT_HANDLERS, {"dictate-stop": begin}, clear=True):
+            client.sendall(b"dictate-stop\n")
+            app_mod._handle_daemon_connection(server, lambda *args: submitted.append(args))
+
+            self.assertEqual(order, ["transition"])
+            self.assertEqual(len(submitted), 1)
+            func, *args = submitted[0]
+            func(*args)
+            self.assertEqual(order, ["transition", "remainder"])
+            self.assertEqual(client.recv(16), b"0\n")
+
+
+class BackgroundPreloadTests(unittest.TestCase):
+    def test_models_ready_is_set_even_when_preload_fails(self) -> None:
+        from voice_controls import app as app_mod
+
+        app_mod.MODELS_READY.clear()
+        try:
+            with patch("voice_controls.app.preload_models", side_effect=RuntimeError("boom")), patch(
+                "voice_controls.app.notify"
+            ) as mock_notify:
+                app_mod._preload_models_worker()
+            self.assertTrue(app_mod.MODELS_READY.is_set())
+            mock_notify.assert_called_once_with("Voice", "Model preload failed: RuntimeError")
+        finally:
+            app_mod.MODELS_READY.set()
+
+
+class WaitPidExitTests(unittest.TestCase):
+    def test_pidfd_and_polling_paths_report_exit_and_timeout(self) -> None:
+        import subprocess
+        import sys
+        from voice_controls.app import _open_pidfd, _wait_pid_exit
+
+        for use_pidfd in (True, False):
+            proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+            pidfd = _open_pidfd(proc.pid) if use_pidfd else None
+            try:
+                self.assertFalse(_wait_pid_exit(proc.pid, 0.1, pidfd))
+                proc.kill()
+                if pidfd is None:
+                    proc.wait()
+                self.assertTrue(_wait_pid_exit(proc.pid, 2.0, pidfd))
+            finally:
+                proc.kill()
+                proc.wait()
+                if pidfd is not None:
+                    os.close(pidfd)
+
 
 class StopCaptureProcessTests(unittest.TestCase):
+    def test_stops_real_child_on_sigint_via_pidfd(self) -> None:
+        import subprocess
+        import sys
+        import time
+        from voice_controls.app import _stop_capture_process
+
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            time.sleep(0.2)
+            started = time.monotonic()
+            _stop_capture_process(proc)
+            self.assertIsNotNone(proc.returncode)
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            proc.kill()
+            proc.wait()
+
     def test_escalates_to_kill_when_wait_timeouts(self) -> None:
         import subprocess
         from voice_controls.app import _stop_capture_process
@@ -228,7 +602,8 @@ class StopCaptureProcessTests(unittest.TestCase):
             None,
         ]
 
-        _stop_capture_process(proc)
+        with patch("voice_controls.app._open_pidfd", return_value=None):
+            _stop_capture_process(proc)
 
         proc.send_signal.assert_called_once()
         proc.terminate.assert_called_once_with()
@@ -60,6 +60,21 @@ class Phase0GuardrailTests(unittest.TestCase):
         self.assertEqual(rc, 0)
         mock_run_daemon.assert_called_once_with()
 
+    def test_parse_args_accepts_equals_form(self) -> None:
+        args = app.parse_args(["--input=dictate-stop"])
+        self.assertEqual(args.input, "dictate-stop")
+        self.assertFalse(args.daemon)
+
+    def test_parse_args_rejects_unknown_input_with_exit_2(self) -> None:
+        with patch("sys.stderr"), self.assertRaises(SystemExit) as ctx:
+            app.parse_args(["--input", "definitely-not-valid"])
+        self.assertEqual(ctx.exception.code, 2)
+
+    def test_parse_args_rejects_unknown_argument_with_exit_2(self) -> None:
+        with patch("sys.stderr"), self.assertRaises(SystemExit) as ctx:
+            app.parse_args(["--bogus"])
+        self.assertEqual(ctx.exception.code, 2)
+
     def test_module_launcher_exists(self) -> None:
         repo_root = Path(__file__).resolve().parents[1]
         launcher = repo_root / "voice_controls" / "__main__.py"
@@ -1,25 +1,24 @@
 """Responsibility: Orchestrate dictation hotkey sessions and daemon IPC."""
 
-import argparse
-import io
-import itertools
 import json
 import os
 import select
-import shutil
+import selectors
 import signal
 import socket
 import subprocess
 import sys
-import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import IO, Callable, NoReturn
 
-from .audio import build_ffmpeg_wav_capture_cmd
+from .audio import build_ffmpeg_wav_capture_cmd, ffmpeg_executable
 from .config import (
+    CAPTURE_DIR,
     DAEMON_CONNECT_TIMEOUT,
+    DAEMON_FORK_START,
     DAEMON_READY_TIMEOUT,
     DAEMON_RESPONSE_TIMEOUT,
     LOG_PATH,
@@ -27,13 +26,24 @@ from .config import (
     SOCKET_PATH,
     VENV_PYTHON,
 )
-from .integrations import inject_text_into_focused_input, notify
+from .integrations import (
+    has_tool,
+    inject_text_into_focused_input,
+    notify,
+    start_notify_worker,
+    stop_notify_worker,
+)
 from .logging_utils import LOGGER
 from .stt import preload_models, transcribe
 
+# Daemon-only modules (tempfile, secrets, concurrent.futures) are imported
+# inside the functions that use them so the per-hotkey client invocation does
+# not pay for them.
 
-DAEMON_REQUEST_IDS = itertools.count(1)
 IPC_MAX_LINE_BYTES = 128
+DAEMON_WORKER_THREADS = 4
+DAEMON_LISTEN_BACKLOG = 64  # Absorbs hotkey bursts while workers are busy.
+CAPTURE_NONCE_BYTES = 8
 STOP_WAIT_SIGINT_SECONDS = 1.5
 STOP_WAIT_SIGTERM_SECONDS = 1.0
 STOP_WAIT_SIGKILL_SECONDS = 0.5
@@ -44,17 +54,33 @@ DEPRECATED_ENV_VARS = (
     "VOICE_STATE_MAX_AGE_SECONDS",
 )
 RECOVERY_STATE_PATH = SOCKET_PATH.with_name("voice-hotkey-dictate-recovery.json")
+# str form for connect()/bind(), computed once rather than per request.
+SOCKET_ADDRESS = os.fspath(SOCKET_PATH)
+# Pre-encoded daemon replies keyed by (rc, wants_json) for the rc values
+# handlers actually return; anything else is encoded on demand.
+RC_RESPONSE_BYTES = {
+    (rc, wants_json): ((json.dumps({"rc": rc}) if wants_json else str(rc)) + "\n").encode("utf-8")
+    for rc in (0, 1, 2)
+    for wants_json in (False, True)
+}
 
 
 @dataclass
 class DictationSession:
     proc: subprocess.Popen
-    tmpdir: Path
     audio_path: Path
     started_at: float
+    nonce: str
 
 
 ACTIVE_SESSION: DictationSession | None = None
+SESSION_LOCK = threading.Lock()
+# Worker threads overlap IPC, recorder control and paste, but Whisper
+# inference runs one request at a time.
+TRANSCRIBE_LOCK = threading.Lock()
+# Cleared while the daemon warms the model in the background; set otherwise.
+MODELS_READY = threading.Event()
+MODELS_READY.set()
 _DEPRECATED_ENV_WARNED = False
 
 
@@ -64,6 +90,18 @@ def _sanitize_transcript(value: str) -> str:
     return f"<redacted len={len(value)}>"
 
 
+class _LazyTranscript:
+    """Log argument that only sanitizes the transcript if the record is emitted."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        return _sanitize_transcript(self.value)
+
+
 def _warn_deprecated_env_vars() -> None:
     global _DEPRECATED_ENV_WARNED
     if _DEPRECATED_ENV_WARNED:
@@ -101,13 +139,27 @@ def _pid_matches_capture(pid: int, audio_path: Path) -> bool:
     return "ffmpeg" in cmdline and str(audio_path).lower() in cmdline
 
 
+def _capture_basename(nonce: str) -> str:
+    return f"capture-{nonce}.wav"
+
+
+def _is_capture_nonce(value: str) -> bool:
+    return len(value) == CAPTURE_NONCE_BYTES * 2 and all(ch in "0123456789abcdef" for ch in value)
+
+
+def _encode_recovery_state(session: DictationSession) -> str:
+    # Fixed-shape payload: only the nonce string goes through JSON escaping.
+    return (
+        f'{{"pid": {int(session.proc.pid)}, '
+        f'"started_at": {float(session.started_at)!r}, '
+        f'"nonce": {json.dumps(session.nonce)}}}'
+    )
+
+
 def _write_recovery_state(session: DictationSession) -> None:
-    payload = {
-        "pid": session.proc.pid,
-        "tmpdir": str(session.tmpdir),
-        "audio_path": str(session.audio_path),
-        "started_at": session.started_at,
-    }
+    import tempfile
+
+    payload = _encode_recovery_state(session)
     RECOVERY_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(
         prefix=f".{RECOVERY_STATE_PATH.name}.",
@@ -115,12 +167,12 @@ def _write_recovery_state(session: DictationSession) -> None:
         dir=str(RECOVERY_STATE_PATH.parent),
     )
     tmp_path = Path(tmp_name)
+    # The file only has to outlive a daemon crash, not a power loss (which also
+    # kills the recorder), so the atomic rename is enough and fsync is skipped.
+    # mkstemp already creates the file with 0600 permissions.
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload))
-            handle.flush()
-            os.fsync(handle.fileno())
-        tmp_path.chmod(0o600)
+            handle.write(payload)
         os.replace(tmp_path, RECOVERY_STATE_PATH)
     finally:
         tmp_path.unlink(missing_ok=True)
@@ -131,10 +183,12 @@ def _clear_recovery_state() -> None:
 
 
 def _load_recovery_state() -> dict | None:
-    if not RECOVERY_STATE_PATH.exists():
-        return None
+    # Read directly instead of checking exists() first: one open, and no
+    # window for the file to vanish in between.
     try:
-        payload = json.loads(RECOVERY_STATE_PATH.read_text(encoding="utf-8"))
+        payload = json.loads(RECOVERY_STATE_PATH.read_bytes())
+    except FileNotFoundError:
+        return None
     except Exception as exc:
         LOGGER.warning("Could not parse recovery session state; dropping stale file: %s", exc)
         _clear_recovery_state()
@@ -145,21 +199,37 @@ def _load_recovery_state() -> dict | None:
     return payload
 
 
-def _cleanup_recovery_tmpdir(tmpdir_raw: str) -> None:
-    if not tmpdir_raw:
-        return
-    tmpdir = Path(tmpdir_raw)
+def _discard_capture(audio_path: Path) -> None:
+    # Captures share CAPTURE_DIR, so cleanup is a single unlink per session.
     try:
-        tmpdir_resolved = tmpdir.resolve()
-        base = Path(tempfile.gettempdir()).resolve()
-        if tmpdir_resolved.parent != base:
-            return
-        if not tmpdir_resolved.name.startswith("voice-dictate-hold-"):
-            return
-    except OSError:
-        return
-    if tmpdir.exists():
-        shutil.rmtree(tmpdir, ignore_errors=True)
+        os.unlink(audio_path)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        LOGGER.warning("Could not remove capture file path=%s err=%s", audio_path, exc)
+
+
+def _open_pidfd(pid: int) -> int | None:
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+def _wait_pid_exit(pid: int, timeout: float, pidfd: int | None) -> bool:
+    """Return True once ``pid`` has exited, False if it is still alive after ``timeout``."""
+    if pidfd is not None:
+        # A pidfd turns readable when the process exits, child of ours or not.
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        return bool(poller.poll(int(timeout * 1000)))
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _pid_alive(pid):
+            return True
+        time.sleep(0.05)
+    return not _pid_alive(pid)
 
 
 def _stop_capture_pid(pid: int, audio_path: Path) -> None:
@@ -171,54 +241,48 @@ def _stop_capture_pid(pid: int, audio_path: Path) -> None:
         LOGGER.warning("Refusing to signal recovery pid=%s due to cmdline mismatch", pid)
         return
 
+    pidfd = _open_pidfd(pid)
     try:
-        os.kill(pid, signal.SIGINT)
-    except OSError:
-        return
-
-    deadline = time.time() + STOP_WAIT_SIGINT_SECONDS
-    while time.time() < deadline:
-        if not _pid_alive(pid):
-            return
-        time.sleep(0.05)
-
-    try:
-        os.kill(pid, signal.SIGTERM)
-    except OSError:
-        return
+        for sig, timeout in ((signal.SIGINT, STOP_WAIT_SIGINT_SECONDS), (signal.SIGTERM, STOP_WAIT_SIGTERM_SECONDS)):
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                return
+            if _wait_pid_exit(pid, timeout, pidfd):
+                return
 
-    deadline = time.time() + STOP_WAIT_SIGTERM_SECONDS
-    while time.time() < deadline:
-        if not _pid_alive(pid):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
             return
-        time.sleep(0.05)
-
-    try:
-        os.kill(pid, signal.SIGKILL)
-    except OSError:
-        return
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
 
 
 def _recv_line(sock: socket.socket, max_bytes: int = IPC_MAX_LINE_BYTES) -> str:
-    raw = bytearray()
-    while True:
-        block = sock.recv(1024)
-        if not block:
+    # One buffer sized one byte past the limit: reads land in place, and a
+    # full buffer without a newline means the line is too long.
+    buf = bytearray(max_bytes + 1)
+    view = memoryview(buf)
+    size = 0
+    while size < len(buf):
+        count = sock.recv_into(view[size:])
+        if not count:
             break
-        if b"\n" in block:
-            idx = block.index(b"\n")
-            raw.extend(block[: idx + 1])
+        idx = buf.find(b"\n", size, size + count)
+        if idx >= 0:
+            size = idx + 1
             break
-        raw.extend(block)
-        if len(raw) > max_bytes:
-            raise ValueError("request_too_large")
+        size += count
 
-    if not raw:
+    if not size:
         raise ValueError("empty_request")
-    if len(raw) > max_bytes:
+    if size > max_bytes:
         raise ValueError("request_too_large")
 
-    line = raw.split(b"\n", 1)[0].decode("utf-8").strip()
+    end = size - 1 if buf[size - 1] == 0x0A else size
+    line = str(view[:end], "utf-8").strip()
     if not line:
         raise ValueError("empty_request")
     return line
@@ -226,22 +290,45 @@ def _recv_line(sock: socket.socket, max_bytes: int = IPC_MAX_LINE_BYTES) -> str:
 
 def validate_environment() -> bool:
     """Verify required binaries exist and log warnings for optional tools."""
-    if not shutil.which("ffmpeg"):
+    # has_tool memoizes shutil.which, so notify/paste reuse these PATH scans;
+    # ffmpeg is checked through the same cached lookup the recorder spawn uses.
+    if ffmpeg_executable() is None:
         LOGGER.error("Missing required tool: ffmpeg")
         notify("Voice", "Missing required tool: ffmpeg")
         return False
 
     for tool in ("hyprctl", "wl-copy", "notify-send"):
-        if not shutil.which(tool):
+        if not has_tool(tool):
             LOGGER.warning("Missing optional tool: %s", tool)
 
     return True
 
 
+def _wait_capture_exit(proc: subprocess.Popen, timeout: float, pidfd: int | None) -> None:
+    """Popen.wait(timeout) that wakes on a pidfd instead of Popen's sleep backoff.
+
+    Raises subprocess.TimeoutExpired like Popen.wait when the recorder is
+    still running after ``timeout``.
+    """
+    if pidfd is not None and not _wait_pid_exit(proc.pid, timeout, pidfd):
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    proc.wait(timeout=timeout)
+
+
 def _stop_capture_process(proc: subprocess.Popen) -> None:
     if proc.poll() is not None:
         return
 
+    # Our own unreaped child, so the pid cannot be recycled under the pidfd.
+    pidfd = _open_pidfd(proc.pid)
+    try:
+        _escalate_capture_stop(proc, pidfd)
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def _escalate_capture_stop(proc: subprocess.Popen, pidfd: int | None) -> None:
     try:
         proc.send_signal(signal.SIGINT)
     except ProcessLookupError:
@@ -250,7 +337,7 @@ def _stop_capture_process(proc: subprocess.Popen) -> None:
         LOGGER.warning("Could not stop recorder with SIGINT: %s", exc)
     else:
         try:
-            proc.wait(timeout=STOP_WAIT_SIGINT_SECONDS)
+            _wait_capture_exit(proc, STOP_WAIT_SIGINT_SECONDS, pidfd)
             return
         except subprocess.TimeoutExpired:
             LOGGER.warning("Recorder still alive after SIGINT; escalating to SIGTERM pid=%s", proc.pid)
@@ -263,7 +350,7 @@ def _stop_capture_process(proc: subprocess.Popen) -> None:
         LOGGER.warning("Could not stop recorder with SIGTERM: %s", exc)
     else:
         try:
-            proc.wait(timeout=STOP_WAIT_SIGTERM_SECONDS)
+            _wait_capture_exit(proc, STOP_WAIT_SIGTERM_SECONDS, pidfd)
             return
         except subprocess.TimeoutExpired:
             LOGGER.warning("Recorder still alive after SIGTERM; escalating to SIGKILL pid=%s", proc.pid)
@@ -277,19 +364,25 @@ def _stop_capture_process(proc: subprocess.Popen) -> None:
         return
 
     try:
-        proc.wait(timeout=STOP_WAIT_SIGKILL_SECONDS)
+        _wait_capture_exit(proc, STOP_WAIT_SIGKILL_SECONDS, pidfd)
     except subprocess.TimeoutExpired:
         LOGGER.error("Recorder still alive after SIGKILL pid=%s", proc.pid)
 
 
 def _process_captured_audio(audio_path: Path) -> int:
-    if not audio_path.exists() or audio_path.stat().st_size == 0:
+    try:
+        audio_size = os.stat(audio_path).st_size
+    except OSError:
+        audio_size = 0
+    if audio_size == 0:
         notify("Voice", "No speech captured")
         LOGGER.info("Voice hotkey end status=no_speech source=dictate")
         return 0
 
+    MODELS_READY.wait()
     try:
-        text, detected_language, language_probability = transcribe(audio_path, language="en")
+        with TRANSCRIBE_LOCK:
+            text, detected_language, language_probability = transcribe(audio_path, language="en")
     except Exception as exc:
         notify("Voice", f"Transcription failed: {type(exc).__name__}")
         LOGGER.exception("dictate transcription failed: %s", exc)
@@ -301,7 +394,7 @@ def _process_captured_audio(audio_path: Path) -> int:
         "Dictation hold language_detected=%s probability=%.3f text=%s",
         detected_language,
         probability,
-        _sanitize_transcript(spoken),
+        _LazyTranscript(spoken),
     )
 
     if not spoken:
@@ -311,11 +404,11 @@ def _process_captured_audio(audio_path: Path) -> int:
 
     if inject_text_into_focused_input(spoken):
         notify("Voice", "Dictation pasted")
-        LOGGER.info("Voice hotkey end status=ok source=dictate text=%s", _sanitize_transcript(spoken))
+        LOGGER.info("Voice hotkey end status=ok source=dictate text=%s", _LazyTranscript(spoken))
         return 0
 
     notify("Voice", "Dictation paste failed")
-    LOGGER.info("Voice hotkey end status=paste_failed source=dictate text=%s", _sanitize_transcript(spoken))
+    LOGGER.info("Voice hotkey end status=paste_failed source=dictate text=%s", _LazyTranscript(spoken))
     return 1
 
 
@@ -323,37 +416,87 @@ def _process_captured_audio(audio_path: Path) -> int:
 
 def _start_session() -> int:
     """Start a press-and-hold dictation capture in daemon memory."""
-    global ACTIVE_SESSION
+    return _run_to_completion(_begin_start_session())
 
-    if ACTIVE_SESSION is not None:
+
+def _stop_session() -> int:
+    """Stop active capture, transcribe audio, paste text, and clean up state."""
+    return _run_to_completion(_begin_stop_session())
+
+
+def _run_to_completion(result: int | Callable[[], int]) -> int:
+    return result() if callable(result) else result
+
+
+def _begin_start_session() -> int | Callable[[], int]:
+    """Attach a new capture session; return its rc or the preempted session's remainder."""
+    import secrets
+
+    with SESSION_LOCK:
+        preempting = ACTIVE_SESSION is not None
+    finish_preempted = None
+    if preempting:
         LOGGER.info("Preempting existing dictate session")
-        preempt_rc = _stop_session()
+        finish_preempted = _detach_session()
+
+    with SESSION_LOCK:
+        if ACTIVE_SESSION is not None:
+            LOGGER.info("Dictate session started by concurrent request; keeping it")
+            rc = 0
+        else:
+            rc = _attach_new_session(secrets.token_hex(CAPTURE_NONCE_BYTES))
+
+    if finish_preempted is None:
+        return rc
+
+    def _finish() -> int:
+        preempt_rc = finish_preempted()
         if preempt_rc != 0:
             LOGGER.warning("Previous session cleanup returned rc=%s; starting new session anyway", preempt_rc)
+        return rc
+
+    return _finish
+
 
-    tmpdir = Path(tempfile.mkdtemp(prefix="voice-dictate-hold-"))
-    audio_path = tmpdir / "capture.wav"
+def _attach_new_session(nonce: str) -> int:
+    # Caller holds SESSION_LOCK.
+    global ACTIVE_SESSION
+
+    try:
+        CAPTURE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError as exc:
+        LOGGER.error("Could not create capture directory path=%s err=%s", CAPTURE_DIR, exc)
+        notify("Voice", "Dictation start failed")
+        return 1
+    # The nonce ends up in ffmpeg's argv, so recovery can tell our recorder
+    # apart from any other ffmpeg writing to a similarly named path.
+    audio_path = CAPTURE_DIR / _capture_basename(nonce)
 
     try:
         proc = subprocess.Popen(
             build_ffmpeg_wav_capture_cmd(audio_path),
+            executable=ffmpeg_executable(),
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
     except FileNotFoundError:
-        shutil.rmtree(str(tmpdir), ignore_errors=True)
         notify("Voice", "ffmpeg not found")
         LOGGER.error("Could not start dictate recorder: ffmpeg not found")
         return 1
 
-    ACTIVE_SESSION = DictationSession(proc=proc, tmpdir=tmpdir, audio_path=audio_path, started_at=time.time())
+    ACTIVE_SESSION = DictationSession(
+        proc=proc,
+        audio_path=audio_path,
+        started_at=time.time(),
+        nonce=nonce,
+    )
     try:
         _write_recovery_state(ACTIVE_SESSION)
     except Exception as exc:
         LOGGER.error("Could not persist recovery session state; aborting recording: %s", exc)
         _stop_capture_process(proc)
         ACTIVE_SESSION = None
-        shutil.rmtree(tmpdir, ignore_errors=True)
+        _discard_capture(audio_path)
         notify("Voice", "Dictation start failed")
         return 1
 
@@ -362,53 +505,63 @@ def _start_session() -> int:
     return 0
 
 
-def _stop_session() -> int:
-    """Stop active capture, transcribe audio, paste text, and clean up state."""
-    global ACTIVE_SESSION
-
-    session = ACTIVE_SESSION
-    recovered = _load_recovery_state() if session is None else None
-    if session is None and recovered is None:
+def _begin_stop_session() -> int | Callable[[], int]:
+    """Detach the current session; return rc 0 if none or the remainder that finishes it."""
+    finish = _detach_session()
+    if finish is None:
         LOGGER.info("Voice hotkey end status=no_active_dictate")
         notify("Voice", "No active dictate")
         return 0
+    return finish
 
-    if session is not None:
+
+def _detach_session() -> Callable[[], int] | None:
+    global ACTIVE_SESSION
+
+    # The recovery file is cleared in the same critical section that detaches
+    # the session, so a concurrent stop cannot pick the capture up again
+    # through the recovery path while this one is still transcribing.
+    with SESSION_LOCK:
+        session = ACTIVE_SESSION
         ACTIVE_SESSION = None
-        audio_path = session.audio_path
-        tmpdir = session.tmpdir
-        notify("Voice", "Key released. Processing dictate...")
-        _stop_capture_process(session.proc)
-    else:
-        recovery_payload = recovered
-        if recovery_payload is None:
-            LOGGER.info("Voice hotkey end status=no_active_dictate")
-            notify("Voice", "No active dictate")
-            return 0
-        try:
-            audio_path_raw = str(recovery_payload.get("audio_path", ""))
-            tmpdir_raw = str(recovery_payload.get("tmpdir", ""))
-            pid = int(recovery_payload.get("pid", 0))
-        except (TypeError, ValueError):
-            _clear_recovery_state()
-            LOGGER.info("Voice hotkey end status=no_active_dictate")
-            notify("Voice", "No active dictate")
-            return 0
-        if not audio_path_raw or not tmpdir_raw:
+        recovered = _load_recovery_state() if session is None else None
+        if session is not None or recovered is not None:
             _clear_recovery_state()
-            LOGGER.info("Voice hotkey end status=no_active_dictate")
-            notify("Voice", "No active dictate")
-            return 0
-        audio_path = Path(audio_path_raw)
-        tmpdir = Path(tmpdir_raw)
-        notify("Voice", "Recovered previous session. Processing dictate...")
-        _stop_capture_pid(pid, audio_path)
 
+    if session is not None:
+        return lambda: _finish_session(session)
+    if recovered is None:
+        return None
+    try:
+        pid = int(recovered.get("pid", 0))
+        nonce = str(recovered.get("nonce", ""))
+    except (TypeError, ValueError):
+        return None
+    if not _is_capture_nonce(nonce):
+        return None
+    # The capture path is fixed by construction, so it is derived rather
+    # than trusted from the state file.
+    audio_path = CAPTURE_DIR / _capture_basename(nonce)
+    return lambda: _finish_recovered_session(pid, audio_path)
+
+
+def _finish_session(session: DictationSession) -> int:
+    notify("Voice", "Key released. Processing dictate...")
+    _stop_capture_process(session.proc)
+    return _process_and_discard_capture(session.audio_path)
+
+
+def _finish_recovered_session(pid: int, audio_path: Path) -> int:
+    notify("Voice", "Recovered previous session. Processing dictate...")
+    _stop_capture_pid(pid, audio_path)
+    return _process_and_discard_capture(audio_path)
+
+
+def _process_and_discard_capture(audio_path: Path) -> int:
     try:
         return _process_captured_audio(audio_path)
     finally:
-        _clear_recovery_state()
-        _cleanup_recovery_tmpdir(str(tmpdir))
+        _discard_capture(audio_path)
 
 
 # -- Dictation ----------------------------------------------------------------
@@ -423,32 +576,138 @@ def stop_press_hold_dictation() -> int:
     return _stop_session()
 
 
-HOLD_INPUT_HANDLERS: dict[str, Callable[[], int]] = {
-    "dictate-start": start_press_hold_dictation,
-    "dictate-stop": stop_press_hold_dictation,
+# Daemon handlers only make the session transition and return either the rc
+# or the slow remainder (recorder stop, transcription, paste) as a callable,
+# so transitions can run in accept order without waiting on transcription.
+HOLD_INPUT_HANDLERS: dict[str, Callable[[], int | Callable[[], int]]] = {
+    "dictate-start": _begin_start_session,
+    "dictate-stop": _begin_stop_session,
 }
+REQUEST_LINE_BYTES = {input_mode: f"{input_mode}\n".encode("utf-8") for input_mode in HOLD_INPUT_HANDLERS}
 
 
 # -- CLI and daemon ------------------------------------------------------------
 
-def parse_args() -> argparse.Namespace:
-    """Parse CLI options for one-shot client mode or daemon mode."""
-    parser = argparse.ArgumentParser(description="Voice dictation hotkey runner")
-    parser.add_argument("--input", default="dictate-start", choices=sorted(HOLD_INPUT_HANDLERS), help="Input action")
-    parser.add_argument("--daemon", action="store_true")
-    return parser.parse_args()
+@dataclass
+class CliArgs:
+    input: str = "dictate-start"
+    daemon: bool = False
+
+
+def _cli_usage() -> str:
+    return f"usage: voice_controls [-h] [--input {{{','.join(sorted(HOLD_INPUT_HANDLERS))}}}] [--daemon]"
+
+
+def _cli_error(message: str) -> NoReturn:
+    print(f"{_cli_usage()}\nvoice_controls: error: {message}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def parse_args(argv: list[str] | None = None) -> CliArgs:
+    """Parse CLI options for one-shot client mode or daemon mode.
+
+    Hand-rolled instead of argparse: the hotkey client runs on every key
+    press and only ever sees ``--input <mode>`` or ``--daemon``.
+    """
+    args = CliArgs()
+    remaining = list(sys.argv[1:] if argv is None else argv)
+    while remaining:
+        arg = remaining.pop(0)
+        if arg in ("-h", "--help"):
+            print(f"{_cli_usage()}\n\nVoice dictation hotkey runner")
+            raise SystemExit(0)
+        if arg == "--daemon":
+            args.daemon = True
+            continue
+        if arg == "--input" or arg.startswith("--input="):
+            if arg == "--input":
+                if not remaining:
+                    _cli_error("argument --input: expected one argument")
+                value = remaining.pop(0)
+            else:
+                value = arg.split("=", 1)[1]
+            if value not in HOLD_INPUT_HANDLERS:
+                choices = ", ".join(repr(choice) for choice in sorted(HOLD_INPUT_HANDLERS))
+                _cli_error(f"argument --input: invalid choice: {value!r} (choose from {choices})")
+            args.input = value
+            continue
+        _cli_error(f"unrecognized arguments: {arg}")
+    return args
+
+
+@dataclass
+class ForkedDaemon:
+    """Popen-like handle for a daemon forked directly from the client process."""
+
+    pid: int
+    stdout: IO[str]
+
+    def terminate(self) -> None:
+        os.kill(self.pid, signal.SIGTERM)
 
 
-def start_daemon() -> subprocess.Popen | None:
+def _can_fork_daemon(runtime_python: str) -> bool:
+    if not DAEMON_FORK_START or not hasattr(os, "fork"):
+        return False
+    # Forking is only safe while the client is single-threaded, and only
+    # equivalent when the daemon would have run on this same interpreter.
+    if threading.active_count() != 1:
+        return False
+    # Compare paths without resolving symlinks: a venv's bin/python links to
+    # the base interpreter but selects the venv's site-packages, so a client
+    # on the base python must still exec the venv interpreter.
+    return os.path.abspath(runtime_python) == os.path.abspath(sys.executable)
+
+
+def _fork_daemon() -> ForkedDaemon:
+    """Fork the daemon from this client, skipping interpreter start-up and imports."""
+    read_fd, write_fd = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid != 0:
+        os.close(write_fd)
+        return ForkedDaemon(pid=pid, stdout=os.fdopen(read_fd, "r"))
+
+    rc = 1
+    try:
+        os.setsid()
+        os.close(read_fd)
+        devnull_fd = os.open(os.devnull, os.O_RDWR)
+        try:
+            stderr_fd = os.open(LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        except OSError:
+            stderr_fd = devnull_fd
+        os.dup2(devnull_fd, 0)
+        os.dup2(write_fd, 1)
+        os.dup2(stderr_fd, 2)
+        for fd in {devnull_fd, write_fd, stderr_fd}:
+            if fd > 2:
+                os.close(fd)
+        rc = run_daemon()
+    except BaseException:
+        LOGGER.exception("Forked voice daemon crashed")
+    finally:
+        os._exit(rc)
+
+
+def start_daemon() -> subprocess.Popen | ForkedDaemon | None:
     """Spawn the daemon as a detached background process."""
     SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
     runtime_python = str(VENV_PYTHON if VENV_PYTHON.exists() else Path(sys.executable))
+    if _can_fork_daemon(runtime_python):
+        try:
+            LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            return _fork_daemon()
+        except OSError as exc:
+            LOGGER.warning("Could not fork daemon; spawning a new interpreter instead: %s", exc)
+
     repo_root = str(Path(__file__).resolve().parents[1])
     env = os.environ.copy()
     current_pythonpath = env.get("PYTHONPATH", "")
     env["PYTHONPATH"] = repo_root if not current_pythonpath else f"{repo_root}:{current_pythonpath}"
-    stderr_log_handle: io.TextIOBase | None = None
-    stderr_target: int | io.TextIOBase
+    stderr_log_handle: IO[str] | None = None
+    stderr_target: int | IO[str]
 
     try:
         LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -477,7 +736,7 @@ def start_daemon() -> subprocess.Popen | None:
             stderr_log_handle.close()
 
 
-def _wait_for_daemon_ready(proc: subprocess.Popen) -> bool:
+def _wait_for_daemon_ready(proc: subprocess.Popen | ForkedDaemon) -> bool:
     if proc.stdout is None:
         return False
 
@@ -523,9 +782,13 @@ def _parse_rc_line(line: str) -> int:
 def _send_daemon_request(input_mode: str) -> int:
     with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
         client.settimeout(DAEMON_CONNECT_TIMEOUT)
-        client.connect(str(SOCKET_PATH))
+        client.connect(SOCKET_ADDRESS)
         client.settimeout(DAEMON_RESPONSE_TIMEOUT)
-        client.sendall(f"{input_mode}\n".encode("utf-8"))
+        request_line = REQUEST_LINE_BYTES.get(input_mode)
+        client.sendall(request_line if request_line is not None else f"{input_mode}\n".encode("utf-8"))
+        # One request per connection: half-close so the daemon sees EOF right
+        # after the line instead of waiting on more bytes.
+        client.shutdown(socket.SHUT_WR)
         response_line = _recv_line(client)
     return _parse_rc_line(response_line)
 
@@ -553,10 +816,15 @@ def request_daemon(input_mode: str) -> int:
             return 1
 
 
-def _execute_daemon_request(request: object) -> int:
-    """Validate daemon request and run the mapped input handler."""
-    request_id = next(DAEMON_REQUEST_IDS)
-    started_at = time.time()
+def _execute_daemon_request(request: object) -> int | Callable[[], int]:
+    """Validate daemon request and run the mapped input handler.
+
+    Returns the rc, or a callable that runs the handler's remainder with the
+    same logging and error mapping when the handler deferred its slow part.
+    """
+    # CLOCK_MONOTONIC doubles as a contention-free request id and the start mark.
+    started_ns = time.monotonic_ns()
+    request_id = started_ns
     if not isinstance(request, str):
         LOGGER.warning(
             "Rejected daemon request with invalid request type=%s request_id=%s",
@@ -572,16 +840,25 @@ def _execute_daemon_request(request: object) -> int:
 
     LOGGER.info("Voice daemon request start id=%s input=%s", request_id, input_mode)
 
-    try:
-        rc = handler()
-    except Exception as exc:
-        elapsed_ms = int((time.time() - started_at) * 1000)
-        LOGGER.exception("Voice daemon request failed id=%s input=%s duration_ms=%s: %s", request_id, input_mode, elapsed_ms, exc)
-        return 1
+    def _run(step: Callable[[], int | Callable[[], int]]) -> int | Callable[[], int]:
+        try:
+            result = step()
+        except Exception as exc:
+            elapsed_ms = (time.monotonic_ns() - started_ns) // 1_000_000
+            LOGGER.exception("Voice daemon request failed id=%s input=%s duration_ms=%s: %s", request_id, input_mode, elapsed_ms, exc)
+            return 1
+        if callable(result):
+            remainder = result
+
+            def _finish() -> int:
+                return _run_to_completion(_run(remainder))
 
-    elapsed_ms = int((time.time() - started_at) * 1000)
-    LOGGER.info("Voice daemon request end id=%s input=%s rc=%s duration_ms=%s", request_id, input_mode, rc, elapsed_ms)
-    return rc
+            return _finish
+        elapsed_ms = (time.monotonic_ns() - started_ns) // 1_000_000
+        LOGGER.info("Voice daemon request end id=%s input=%s rc=%s duration_ms=%s", request_id, input_mode, result, elapsed_ms)
+        return result
+
+    return _run(handler)
 
 
 def _decode_request_line(line: str) -> tuple[object, bool]:
@@ -597,34 +874,56 @@ def _decode_request_line(line: str) -> tuple[object, bool]:
     return stripped, False
 
 
-def _handle_daemon_connection(conn: socket.socket) -> None:
-    """Process a single client socket: decode request, execute, return rc."""
-    with conn:
-        try:
-            conn.settimeout(DAEMON_CONNECT_TIMEOUT)
-            request = _recv_line(conn)
-        except (socket.timeout, UnicodeDecodeError, ValueError, OSError) as exc:
-            LOGGER.warning("Voice daemon request parse failed: %s", exc)
-            request = None
-            wants_json = False
-        else:
-            request, wants_json = _decode_request_line(request)
+def _encode_rc_response(rc: int, wants_json: bool) -> bytes:
+    cached = RC_RESPONSE_BYTES.get((rc, wants_json))
+    if cached is not None:
+        return cached
+    return ((json.dumps({"rc": rc}) if wants_json else str(rc)) + "\n").encode("utf-8")
+
 
-        rc = _execute_daemon_request(request) if request is not None else 1
+def _send_rc_and_close(conn: socket.socket, rc: int, wants_json: bool) -> None:
+    with conn:
         try:
-            if wants_json:
-                conn.sendall((json.dumps({"rc": rc}) + "\n").encode("utf-8"))
-            else:
-                conn.sendall(f"{rc}\n".encode("utf-8"))
+            conn.sendall(_encode_rc_response(rc, wants_json))
         except OSError as exc:
             LOGGER.debug("Voice daemon response send failed rc=%s err=%s", rc, exc)
 
 
+def _finish_daemon_connection(conn: socket.socket, remainder: Callable[[], int], wants_json: bool) -> None:
+    _send_rc_and_close(conn, remainder(), wants_json)
+
+
+def _handle_daemon_connection(conn: socket.socket, submit: Callable[..., object] | None = None) -> None:
+    """Process a single client socket: decode request, execute, return rc.
+
+    The session transition runs on the calling thread. When ``submit`` is
+    given, a deferred remainder and the reply are handed to it instead of
+    being run inline.
+    """
+    try:
+        conn.settimeout(DAEMON_CONNECT_TIMEOUT)
+        request = _recv_line(conn)
+    except (socket.timeout, UnicodeDecodeError, ValueError, OSError) as exc:
+        LOGGER.warning("Voice daemon request parse failed: %s", exc)
+        request = None
+        wants_json = False
+    else:
+        request, wants_json = _decode_request_line(request)
+
+    result = _execute_daemon_request(request) if request is not None else 1
+    if callable(result):
+        if submit is not None:
+            submit(_finish_daemon_connection, conn, result, wants_json)
+            return
+        result = result()
+    _send_rc_and_close(conn, result, wants_json)
+
+
 def _socket_has_live_daemon() -> bool:
     try:
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
             probe.settimeout(DAEMON_CONNECT_TIMEOUT)
-            probe.connect(str(SOCKET_PATH))
+            probe.connect(SOCKET_ADDRESS)
         return True
     except ConnectionRefusedError:
         return False
@@ -632,21 +931,46 @@ def _socket_has_live_daemon() -> bool:
         return False
 
 
+def _preload_models_worker() -> None:
+    try:
+        preload_models()
+    except Exception as exc:
+        notify("Voice", f"Model preload failed: {type(exc).__name__}")
+        LOGGER.exception("Model preload failed; transcription will retry loading on demand: %s", exc)
+    finally:
+        MODELS_READY.set()
+
+
+def _start_background_preload() -> None:
+    """Warm the STT model off the accept path; transcription waits on MODELS_READY."""
+    MODELS_READY.clear()
+    threading.Thread(target=_preload_models_worker, name="voice-preload", daemon=True).start()
+
+
+def _drain_wakeup_socket(sock: socket.socket) -> None:
+    while True:
+        try:
+            if not sock.recv(64):
+                return
+        except (BlockingIOError, InterruptedError):
+            return
+
+
 def run_daemon() -> int:
     """Run single-instance UNIX-socket daemon loop for hotkey actions."""
     global ACTIVE_SESSION
 
+    from concurrent.futures import ThreadPoolExecutor
+
     if not validate_environment():
         return 1
 
     _warn_deprecated_env_vars()
 
-    _shutdown = False
-    server: socket.socket | None = None
+    shutdown_requested = threading.Event()
 
     def _request_shutdown(signum: int, frame: object) -> None:
-        nonlocal _shutdown
-        _shutdown = True
+        shutdown_requested.set()
         LOGGER.info("Voice hotkey daemon received signal %s; shutting down", signum)
         session = ACTIVE_SESSION
         if session is not None:
@@ -654,11 +978,6 @@ def run_daemon() -> int:
                 _stop_capture_process(session.proc)
             except Exception as exc:
                 LOGGER.warning("Failed stopping active recorder during shutdown: %s", exc)
-        if server is not None:
-            try:
-                server.close()
-            except OSError:
-                pass
 
     signal.signal(signal.SIGTERM, _request_shutdown)
     signal.signal(signal.SIGINT, _request_shutdown)
@@ -672,14 +991,14 @@ def run_daemon() -> int:
 
     LOGGER.info("Voice hotkey daemon starting socket=%s pid=%s", SOCKET_PATH, os.getpid())
 
+    start_notify_worker()
     bound = False
     try:
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
-            server = server_socket
             # Set a restrictive umask before bind() so the socket is created
             old_umask = os.umask(0o177)
             try:
-                server_socket.bind(str(SOCKET_PATH))
+                server_socket.bind(SOCKET_ADDRESS)
                 bound = True
             finally:
                 os.umask(old_umask)
@@ -687,31 +1006,54 @@ def run_daemon() -> int:
                 SOCKET_PATH.chmod(0o600)
             except Exception as exc:
                 LOGGER.warning("Could not chmod daemon socket: %s", exc)
-            server_socket.listen(8)
+            server_socket.listen(DAEMON_LISTEN_BACKLOG)
 
-            try:
-                preload_models()
-            except Exception as exc:
-                notify("Voice", f"Model preload failed: {type(exc).__name__}")
-                LOGGER.exception("Model preload failed; daemon exiting: %s", exc)
-                return 1
+            _start_background_preload()
 
             print("READY", flush=True)
             LOGGER.info("Voice hotkey daemon listening socket=%s pid=%s", SOCKET_PATH, os.getpid())
 
-            while not _shutdown:
-                try:
-                    conn, _ = server_socket.accept()
-                except OSError:
-                    if _shutdown:
-                        break
-                    continue
-                _handle_daemon_connection(conn)
+            # Signals wake the selector through a self-pipe instead of closing the
+            # listening socket out from under a blocked accept().
+            wakeup_reader, wakeup_writer = socket.socketpair()
+            wakeup_reader.setblocking(False)
+            wakeup_writer.setblocking(False)
+            server_socket.setblocking(False)
+            old_wakeup_fd = signal.set_wakeup_fd(wakeup_writer.fileno(), warn_on_full_buffer=False)
+            # One session thread applies start/stop transitions in accept order;
+            # recorder shutdown and transcription are handed to the pool.
+            session_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice-session")
+            pool = ThreadPoolExecutor(max_workers=DAEMON_WORKER_THREADS, thread_name_prefix="voice-ipc")
+            try:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(server_socket, selectors.EVENT_READ)
+                    selector.register(wakeup_reader, selectors.EVENT_READ)
+                    while not shutdown_requested.is_set():
+                        for key, _ in selector.select():
+                            if key.fileobj is wakeup_reader:
+                                _drain_wakeup_socket(wakeup_reader)
+                                continue
+                            try:
+                                conn, _ = server_socket.accept()
+                            except (BlockingIOError, InterruptedError):
+                                continue
+                            except OSError as exc:
+                                LOGGER.warning("Voice daemon accept failed: %s", exc)
+                                continue
+                            conn.setblocking(True)
+                            session_worker.submit(_handle_daemon_connection, conn, pool.submit)
+            finally:
+                session_worker.shutdown(wait=True)
+                pool.shutdown(wait=True)
+                signal.set_wakeup_fd(old_wakeup_fd)
+                wakeup_reader.close()
+                wakeup_writer.close()
 
             LOGGER.info("Voice hotkey daemon exiting cleanly")
     finally:
         if bound:
             SOCKET_PATH.unlink(missing_ok=True)
+        stop_notify_worker()
     return 0
 
 
@@ -1,10 +1,20 @@
 """Responsibility: Build ffmpeg command lines for audio capture."""
 
+import shutil
+from functools import lru_cache
 from pathlib import Path
 
 from .config import AUDIO_BACKEND, AUDIO_SOURCE
 
 
+@lru_cache(maxsize=None)
+def ffmpeg_executable() -> str | None:
+    # Resolved once per process so each recorder spawn execs a fixed path
+    # instead of walking PATH; argv[0] stays "ffmpeg". None means ffmpeg is
+    # missing, which validate_environment reports.
+    return shutil.which("ffmpeg")
+
+
 def build_ffmpeg_wav_capture_cmd(output_path: Path) -> list[str]:
     cmd = [
         "ffmpeg",
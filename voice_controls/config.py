@@ -39,6 +39,9 @@ def env_bool(name: str, default: bool) -> bool:
 MODEL_NAME = os.environ.get("VOICE_MODEL", "large-v3-turbo")
 DEVICE_CANDIDATES = [d.strip() for d in os.environ.get("VOICE_DEVICE", "cuda,cpu").split(",") if d.strip()]
 COMPUTE_TYPE_OVERRIDE = os.environ.get("VOICE_COMPUTE_TYPE")
+# Run one throwaway transcription after model load so the first real request
+# does not pay for backend kernel initialization.
+MODEL_WARMUP = env_bool("VOICE_MODEL_WARMUP", True)
 AUDIO_BACKEND = os.environ.get("VOICE_AUDIO_BACKEND", "pulse")
 AUDIO_SOURCE = os.environ.get("VOICE_AUDIO_SOURCE", "default")
 
@@ -51,9 +54,16 @@ _state_dir = Path.home() / ".local" / "state"
 
 LOG_PATH = _state_dir / "voice-hotkey.log"
 SOCKET_PATH = _runtime_dir / "voice-hotkey.sock"
+# Private directory reused across sessions for capture-<nonce>.wav files.
+CAPTURE_DIR = _runtime_dir / "voice-hotkey-capture"
 DAEMON_CONNECT_TIMEOUT = env_float("VOICE_DAEMON_CONNECT_TIMEOUT", 0.4)
 DAEMON_RESPONSE_TIMEOUT = env_int("VOICE_DAEMON_RESPONSE_TIMEOUT", 180)
 DAEMON_READY_TIMEOUT = env_float("VOICE_DAEMON_READY_TIMEOUT", 60.0)
+# Fork the client into the daemon instead of exec'ing a fresh interpreter when
+# the client already runs on the daemon's Python. A forked daemon keeps the
+# client's command line (e.g. "-m voice_controls --input dictate-start") in
+# ps/pgrep, not "--daemon"; set this to 0 to get a "--daemon" process.
+DAEMON_FORK_START = env_bool("VOICE_DAEMON_FORK_START", True)
 LOG_TRANSCRIPTS = env_bool("VOICE_LOG_TRANSCRIPTS", False)
 NOTIFY_TIMEOUT_MS = env_int("VOICE_NOTIFY_TIMEOUT_MS", 2200)
 
@@ -1,7 +1,9 @@
 """Responsibility: Integrate with desktop tools for notify and dictation paste."""
 
+import queue  # Hand notifications to the background notifier thread.
 import shutil  # Standard-library shell utilities; shutil.which checks if a command exists in PATH.
 import subprocess  # Run desktop integration commands (hyprctl, wl-copy, notify-send).
+import threading  # Background notifier thread for the daemon.
 import unicodedata  # Inspect Unicode categories while sanitizing dictated text.
 from functools import lru_cache  # Cache function results (Least Recently Used strategy).
 
@@ -15,6 +17,10 @@ from .logging_utils import LOGGER  # Shared logger for integration successes/fai
 NOTIFY_ERROR_SIGNALS = ("failed", "missing", "error", "unavailable", "no speech")
 NOTIFY_SUCCESS_SIGNALS = ("pasted",)
 
+# Set while the daemon's notifier thread runs; notify() then only enqueues.
+_NOTIFY_QUEUE: "queue.SimpleQueue[tuple[str, str] | None] | None" = None
+_NOTIFY_THREAD: threading.Thread | None = None
+
 
 @lru_cache(maxsize=None)
 def has_tool(tool: str) -> bool:
@@ -31,7 +37,51 @@ def _notify_color(body: str) -> str:
     return "rgb(88ccff)"
 
 
+def _notify_worker(notify_queue: "queue.SimpleQueue[tuple[str, str] | None]") -> None:
+    while True:
+        item = notify_queue.get()
+        if item is None:
+            return
+        _send_notification(*item)
+
+
+def start_notify_worker() -> None:
+    """Deliver notify() calls from one background thread, in order.
+
+    The daemon uses this so spawning hyprctl/notify-send does not delay
+    request handling; one-shot CLI processes keep sending inline.
+    """
+    global _NOTIFY_QUEUE, _NOTIFY_THREAD
+    if _NOTIFY_THREAD is not None:
+        return
+    notify_queue: "queue.SimpleQueue[tuple[str, str] | None]" = queue.SimpleQueue()
+    thread = threading.Thread(target=_notify_worker, args=(notify_queue,), name="voice-notify", daemon=True)
+    thread.start()
+    _NOTIFY_QUEUE = notify_queue
+    _NOTIFY_THREAD = thread
+
+
+def stop_notify_worker(timeout: float = 2.0) -> None:
+    """Flush queued notifications and stop the background notifier."""
+    global _NOTIFY_QUEUE, _NOTIFY_THREAD
+    notify_queue, thread = _NOTIFY_QUEUE, _NOTIFY_THREAD
+    if notify_queue is None or thread is None:
+        return
+    _NOTIFY_QUEUE = None
+    _NOTIFY_THREAD = None
+    notify_queue.put(None)
+    thread.join(timeout)
+
+
 def notify(title: str, body: str) -> None:
+    notify_queue = _NOTIFY_QUEUE
+    if notify_queue is not None:
+        notify_queue.put((title, body))
+        return
+    _send_notification(title, body)
+
+
+def _send_notification(title: str, body: str) -> None:
     clean_title = " ".join(title.split()) or "Voice"
     clean_body = " ".join(body.split())
     if not clean_body:
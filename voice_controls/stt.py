@@ -10,6 +10,7 @@ from .config import (  # Model/device/compute configuration values.
     COMPUTE_TYPE_OVERRIDE,
     DEVICE_CANDIDATES,
     MODEL_NAME,
+    MODEL_WARMUP,
 )
 from .logging_utils import LOGGER  # Shared logger for model loading/transcription diagnostics.
 
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
 
 WHISPER_MODELS: dict[tuple[str, str, str], "FasterWhisperModel"] = {}
 WHISPER_MODELS_LOCK = threading.Lock()
+WARMUP_SAMPLE_RATE = 16000  # Matches the ffmpeg capture format (-ar 16000 -ac 1).
+WARMUP_AUDIO_SECONDS = 1.0
 
 
 def ensure_cuda_runtime_paths() -> None:
@@ -130,14 +133,59 @@ def transcribe(audio_path: Path, language: str | None = None) -> tuple[str, str,
     return text, info.language, info.language_probability
 
 
+def _silent_wav_bytes() -> bytes:
+    """Return a mono 16-bit WAV of silence shaped like a real capture."""
+    import io
+    import wave
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(WARMUP_SAMPLE_RATE)
+        wav.writeframes(b"\x00\x00" * int(WARMUP_SAMPLE_RATE * WARMUP_AUDIO_SECONDS))
+    return buffer.getvalue()
+
+
+def warm_up_model(model: "FasterWhisperModel") -> None:
+    """Run throwaway transcriptions of silence through the real request path.
+
+    The input is a WAV file image, so the audio decoder is exercised as for a
+    capture. The first pass uses the same VAD settings as ``transcribe`` so the
+    VAD model is loaded; silence is filtered out there, so a second pass with
+    VAD disabled makes the encoder and decoder actually execute.
+    """
+    import io
+
+    wav_bytes = _silent_wav_bytes()
+    for vad_filter in (True, False):
+        segments, _ = model.transcribe(
+            io.BytesIO(wav_bytes),
+            language="en",
+            vad_filter=vad_filter,
+            without_timestamps=True,
+        )
+        for _ in segments:
+            pass
+
+
 def preload_models() -> None:
     """Warm the Whisper model cache at daemon startup.
 
     Logs a warning and re-raises on failure so the caller can notify the user
     that transcription will not work until the model loads successfully.
+    A failed warmup pass is only logged: the model itself is usable.
     """
     try:
-        get_whisper_model(MODEL_NAME)
+        model = get_whisper_model(MODEL_NAME)
     except Exception as exc:
         LOGGER.warning("Model preload failed name=%s err=%s", MODEL_NAME, exc)
         raise
+
+    if not MODEL_WARMUP:
+        return
+    try:
+        warm_up_model(model)
+        LOGGER.info("Whisper model warmup done name=%s", MODEL_NAME)
+    except Exception as exc:
+        LOGGER.warning("Whisper model warmup failed name=%s err=%s", MODEL_NAME, exc)